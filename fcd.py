@@ -11,21 +11,104 @@ directory from within the program this program requires some additional shell sc
 as expected. These will be installed if install.sh is used or read the README.md for more
 information for manual configuration.
 """
+from __future__ import annotations
+
+import collections
 import logging
 import sys
 import os
-import argparse
+import bisect
+import itertools
 import json
-import readline
+import operator
 
 VERSION = '1.1.0'
 
-# Local file logging, use level=logging.DEBUG for troubleshooting.
-logging.basicConfig(filename=f'{os.path.expanduser("~")}{"/fcd.log"}',
-                    filemode='a', # append
-                    format='%(asctime)s:[%(levelname)s]:%(name)s:%(filename)s:%(funcName)s:\
-%(lineno)d:(%(message)s)',
-                    level=logging.INFO)
+# The users home directory, resolved once and used for all files written by the program.
+HOME_DIR = os.path.expanduser('~')
+
+
+def setup_logging() -> None:
+    """Local file logging to ~/fcd.log. The file is only opened once something is actually
+    logged, most calls never log anything at the default level. Set the environment variable
+    FCD_DEBUG to log at level DEBUG for troubleshooting.
+    """
+    handler = logging.FileHandler(os.path.join(HOME_DIR, 'fcd.log'),
+                                  mode='a', # append
+                                  delay=True)
+    logging.basicConfig(handlers=[handler],
+                        format='%(asctime)s:[%(levelname)s]:%(name)s:%(filename)s:\
+%(funcName)s:%(lineno)d:(%(message)s)',
+                        level=logging.DEBUG if os.environ.get('FCD_DEBUG') else logging.INFO)
+
+
+def read_file(filename: str) -> bytes:
+    """Read a whole file with a single read() system call, bypassing the buffered io layers
+    of open(). Raises OSError on failure.
+
+    Returns: The content of the file as bytes.
+    """
+    fd = os.open(filename, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+def write_all(fd: int, data: bytes) -> None:
+    """Write all of data to the file descriptor fd, normally a single write() system call.
+    Raises OSError on failure.
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def write_file(filename: str, data: bytes) -> None:
+    """Replace the content of a file with data, bypassing the buffered io layers of open().
+    Raises OSError on failure.
+    """
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+def replace_file(filename: str, data: bytes) -> None:
+    """Atomically replace the content of a file with data. The data is written and synced to
+    a uniquely named temporary file in the same directory which is then renamed over the
+    file, so a crash or a concurrent save leaves either the old or a new content but never a
+    truncated or mixed file. A symbolic link is followed, and the permissions of an existing
+    file are kept. Raises OSError on failure.
+    """
+    # Only needed when saving, keep it out of the startup time
+    import tempfile # pylint: disable=import-outside-toplevel
+    filename = os.path.realpath(filename)
+    try:
+        mode = os.stat(filename).st_mode & 0o7777
+    except FileNotFoundError:
+        # The mode a plain open() would have created the file with
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    directory, basename = os.path.split(filename)
+    fd, tmp_filename = tempfile.mkstemp(prefix=f'.{basename}.', suffix='.tmp', dir=directory)
+    try:
+        try:
+            os.fchmod(fd, mode)
+            write_all(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_filename, filename)
+    except OSError:
+        try:
+            os.unlink(tmp_filename)
+        except OSError:
+            pass
+        raise
+
 
 class Color: # pylint: disable=too-many-instance-attributes
     """ANSI Colors to be used in terminal output"""
@@ -110,8 +193,22 @@ def parse_args() -> dict:
     """Parse the command line arguments. If any of the rules defined by this function
     is broken, the program will abort with a clear error message given by argparse.
 
+    The dominant invocations, no argument at all, a single alias or only the version flag,
+    are handled without argparse to keep it out of the startup time.
+
     Returns: vars as a dict with all available arguments as keys.
     """
+    argv = sys.argv[1:]
+    if len(argv) <= 1:
+        arg = argv[0] if argv else None
+        if arg is None or not arg.startswith('-'):
+            return {'add': None, 'delete': None, 'command': None, 'version': False,
+                    'alias': arg}
+        if arg in ('-v', '--version'):
+            return {'add': None, 'delete': None, 'command': None, 'version': True,
+                    'alias': None}
+
+    import argparse # pylint: disable=import-outside-toplevel
     parser = argparse.ArgumentParser(
         description="Fast Change Directory (fcd)",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter)
@@ -129,66 +226,135 @@ def parse_args() -> dict:
     return vars(parser.parse_args())
 
 
-class Files: # pylint: disable=too-few-public-methods
-    """A class with all predefined filenames as class global attributes used by the program."""
+class Files(collections.namedtuple('Files', ('db_file', 'dir_file', 'cmd_file'),
+                                   defaults=(os.path.join(HOME_DIR, '.fcd.json'),
+                                             os.path.join(HOME_DIR, '.fcd_dir'),
+                                             os.path.join(HOME_DIR, '.fcd_cmd')))):
+    """All predefined filenames used by the program.
 
-    def __init__(self) -> None:
-        logging.debug('Files: Create instance')
-        self._db_file = f'{os.path.expanduser("~")}{"/.fcd.json"}'
-        self._dir_file = f'{os.path.expanduser("~")}{"/.fcd_dir"}'
-        self._cmd_file = f'{os.path.expanduser("~")}{"/.fcd_cmd"}'
-
-    # All getter methods
-    @property
-    def db_file(self) -> str:
-        """Filename where the database will be stored"""
-        return self._db_file
-
-    @property
-    def dir_file(self) -> str:
-        """Filename where alias matching directory path will be stored"""
-        return self._dir_file
-
-    @property
-    def cmd_file(self) -> str:
-        """Filename where alias matching command will be stored"""
-        return self._cmd_file
-
-    # All setter methods
-    @db_file.setter
-    def db_file(self, value: str) -> None:
-        """Set the database filename"""
-        logging.debug(value)
-        self._db_file = value
-
-    @dir_file.setter
-    def dir_file(self, value: str) -> None:
-        """Set the directory path filename"""
-        logging.debug(value)
-        self._dir_file = value
-
-    @cmd_file.setter
-    def cmd_file(self, value: str) -> None:
-        """Set the command filename"""
-        logging.debug(value)
-        self._cmd_file = value
+    Attributes:
+        db_file: Filename where the database will be stored
+        dir_file: Filename where alias matching directory path will be stored
+        cmd_file: Filename where alias matching command will be stored
+    """
+    __slots__ = ()
 
 
 class TabComplete: # pylint: disable=too-few-public-methods
     """A TAB completer class for readline
 
-    Args: aliases is a list of strings pulled from the alias keyword in the database and
-        will be used for comparison in the complete function provided to readline.
+    Args: records is a Records instance with all the aliases in the database which will be
+        used for comparison in the complete function provided to readline.
     """
 
-    def __init__(self, aliases: list) -> None:
+    def __init__(self, records: 'Records') -> None:
         logging.debug('TabComplete: Create instance')
-        self._aliases = aliases
+        self._records = records
+        # The text of the last completion, the number of changes to records at that time and
+        # the aliases matching it
+        self._text = None
+        self._changes = 0
+        self._matches = []
+
+    def complete(self, text: str, state: int) -> str | None:
+        """tab completer function
+
+        readline calls this with state 0, 1, 2... until None is returned. All aliases starting
+        with text are looked up once and then returned one at a time. They are kept until
+        the text or the records change, e.g. pressing TAB again to list all candidates reuses
+        them.
+        """
+        if text != self._text or self._records.changes != self._changes:
+            self._text = text
+            self._changes = self._records.changes
+            self._matches = self._records.matches(text)
+        if state < len(self._matches):
+            return self._matches[state]
+        return None
+
+
+class Records:
+    """A view of the records in the database in case insensitive alphabetic order
+
+    The database is the single source of truth, only the sorted order of the aliases is
+    kept here, together with the casefolded sort key of each alias to be able to binary
+    search for an alias or a prefix. Adding or removing an alias keeps the order without
+    sorting everything again.
+
+    The sort key is str.casefold rather than str.lower, so that aliases with non ASCII
+    letters (e.g. 'Straße' and 'strasse') are ordered consistently. Each key is computed
+    once when the view is built, and aliases that only differ in case are ordered by the
+    alias itself to keep the order stable.
+
+    Args: database is the database as a dict of dicts, see Db.load.
+    """
+
+    def __init__(self, database: dict) -> None:
+        logging.debug('Records: Create instance')
+        self._database = database
+        sorted_keys = sorted((alias.casefold(), alias) for alias in database)
+        self._keys = [key for key, _ in sorted_keys]
+        self._aliases = [alias for _, alias in sorted_keys]
+        self._changes = 0
+
+    def __getitem__(self, alias: str) -> tuple:
+        """Return the record for alias as a (directory, command) tuple"""
+        entry = self._database[alias]
+        return entry['directory'], entry['command']
 
-    def complete(self, text: str, state: int) -> str:
-        """tab completer function"""
-        results = [x for x in self._aliases if x.startswith(text)] + [None]
-        return results[state]
+    # All getter methods
+    @property
+    def aliases(self) -> list:
+        """All aliases in sorted order"""
+        return self._aliases
+
+    @property
+    def changes(self) -> int:
+        """The number of aliases added or removed, to be able to tell if a cached search
+        result is still valid"""
+        return self._changes
+
+    def index(self, alias: str) -> int:
+        """Find where alias is, or should be inserted, in aliases
+
+        Returns: The index as an int.
+        """
+        key = alias.casefold()
+        index = bisect.bisect_left(self._keys, key)
+        while (index < len(self._keys) and self._keys[index] == key and
+               self._aliases[index] < alias):
+            index += 1
+        return index
+
+    def matches(self, prefix: str) -> list:
+        """Find all aliases starting with prefix. They are all within the range of aliases
+        where the casefolded prefix matches the sort key, found with a binary search.
+
+        Returns: A list with the matching aliases in sorted order.
+        """
+        key = prefix.casefold()
+        index = bisect.bisect_left(self._keys, key)
+        result = []
+        while index < len(self._keys) and self._keys[index].startswith(key):
+            if self._aliases[index].startswith(prefix):
+                result.append(self._aliases[index])
+            index += 1
+        return result
+
+    def add(self, alias: str) -> None:
+        """Insert an alias, already added to the database, in sorted order"""
+        index = self.index(alias)
+        self._keys.insert(index, alias.casefold())
+        self._aliases.insert(index, alias)
+        self._changes += 1
+
+    def remove(self, alias: str) -> None:
+        """Remove an alias, if present"""
+        index = self.index(alias)
+        if index < len(self._aliases) and self._aliases[index] == alias:
+            del self._keys[index]
+            del self._aliases[index]
+            self._changes += 1
 
 
 class Db:
@@ -198,6 +364,13 @@ class Db:
         logging.debug('Db: Create instance')
         self._db_file = db_file
         self._color = Color()
+        self._created = False
+
+    # All getter methods
+    @property
+    def created(self) -> bool:
+        """True if load created a new database which has not been saved to file yet"""
+        return self._created
 
     def load(self) -> dict:
         """Load the database from file
@@ -207,17 +380,9 @@ class Db:
         """
         logging.debug('Enter')
         try:
-            if os.path.exists(self._db_file):
-                with open(self._db_file, encoding = 'utf-8') as file:
-                    database = json.load(file)
-            else:
-                print(f'{self._color.light_yellow}No database {self._db_file} exists ', end='')
-                print('in your home directory, first time usage?')
-                print('Creates a new database with a dummy record which can be removed later.')
-                print(self._color.reset, end='')
-                json_string = '{"dummy": {"directory": "/dummy", "command": ""}}'
-                database = json.loads(json_string)
-                self.save(database)
+            database = json.loads(read_file(self._db_file))
+        except FileNotFoundError:
+            database = self.create()
         except IOError as io_error:
             logging.error(io_error)
             sys.exit(io_error)
@@ -228,13 +393,37 @@ class Db:
         logging.debug('Exit: %s', database)
         return database
 
+    def create(self) -> dict:
+        """Create a new database, used the first time the program is run. It is written to
+        file by the first call to save, see created.
+
+        Returns: database. A new database with a dummy record.
+        """
+        logging.debug('Enter')
+        print(f'{self._color.light_yellow}No database {self._db_file} exists ', end='')
+        print('in your home directory, first time usage?')
+        print('Creates a new database with a dummy record which can be removed later.')
+        print(self._color.reset, end='')
+        database = {"dummy": {"directory": "/dummy", "command": ""}}
+        self._created = True
+        logging.debug('Exit')
+        return database
+
     def save(self, database: dict) -> None:
         """Save the current database in memory to file
+
+        The records are written in the same case insensitive order as Records keeps them.
+        Sorting the aliases when the database is loaded again is then a single pass over
+        already ordered keys.
         """
         logging.debug('Enter')
+        self._created = False
+        database = {alias: database[alias]
+                    for alias in sorted(database, key=lambda alias: (alias.casefold(), alias))}
         try:
-            with open(self._db_file, 'w', encoding = 'utf-8') as file:
-                json.dump(database, file)
+            # Compact separators, fewer bytes to write and to parse
+            data = json.dumps(database, separators=(',', ':'))
+            replace_file(self._db_file, data.encode('utf-8'))
         except IOError as io_error:
             logging.error(io_error)
             sys.exit(io_error)
@@ -251,12 +440,25 @@ class Fcd:
         self._db_handler = Db(self._files.db_file)
         self._db = self._db_handler.load()
 
-        # Aliases in alphabetic sorted order to be used for tab completion
-        self._aliases = sorted(self._db.keys(), key=str.lower)
-        logging.debug('self._aliases=%s', self._aliases)
-        # A TabComplete instance prepared with a list of aliases created from all records in the
-        # database.
-        self._completer = TabComplete(self._aliases)
+        # All records in alphabetic order, created when first needed, see records.
+        self._records = None
+        # True when self._db has changes not yet saved to file, see flush. A new database
+        # is saved the same way, together with any changes made to it.
+        self._dirty = self._db_handler.created
+        # A TabComplete instance prepared with the aliases from all records in the database,
+        # created together with the readline setup the first time input is read.
+        self._completer = None
+
+    @property
+    def records(self) -> Records:
+        """All records in alphabetic order, which will be used as a helper in combination
+        with the tab completion. Sorting is skipped until first needed since the most common
+        usage, an exact alias, doesn't need it.
+        """
+        if self._records is None:
+            self._records = Records(self._db)
+            logging.debug('aliases=%s', self._records.aliases)
+        return self._records
 
     def save_for_later_execution(self, alias: str) -> None:
         """Save the directory path and command, (if not empty) to the separate files
@@ -270,72 +472,77 @@ class Fcd:
         Returns: None
         """
         logging.debug('Enter')
-        if os.path.isdir(self._db[alias]['directory']):
+        record = self._db[alias]
+        directory = record['directory']
+        command = record['command']
+        if os.path.isdir(directory):
             # The directory path stored in the database actually exists in the file system,
             # save the directory path to file.
-            dir_path = f'{self._db[alias]["directory"]}\n'
+            dir_path = f'{directory}\n'
             try:
-                with open(self._files.dir_file, 'w', encoding = 'utf-8') as file:
-                    logging.debug('Write "%s" to %s', dir_path, self._files.dir_file)
-                    file.write(dir_path)
+                logging.debug('Write "%s" to %s', dir_path, self._files.dir_file)
+                write_file(self._files.dir_file, dir_path.encode('utf-8'))
             except IOError as io_error:
                 logging.error(io_error)
                 sys.exit(io_error)
 
-            if self._db[alias]['command'] != '':
+            if command != '':
                 # This record have an associated command, save the cmd to file.
-                cmd = f'{self._db[alias]["command"]}\n'
+                cmd = f'{command}\n'
                 try:
-                    with open(self._files.cmd_file, 'w', encoding = 'utf-8') as file:
-                        logging.debug('Write "%s" to %s', cmd, self._files.cmd_file)
-                        file.write(cmd)
+                    logging.debug('Write "%s" to %s', cmd, self._files.cmd_file)
+                    write_file(self._files.cmd_file, cmd.encode('utf-8'))
                 except IOError as io_error:
                     logging.error(io_error)
                     sys.exit(io_error)
         else:
-            print(f'{self._color.light_red}Directory "{self._db[alias]["directory"]}" ', end='')
+            print(f'{self._color.light_red}Directory "{directory}" ', end='')
             print(f'doesn\'t exist, recommended to remove record{self._color.reset}')
-            logging.warning('%s doesn\'t exist', self._db[alias]["directory"])
+            logging.warning('%s doesn\'t exist', directory)
             sys.exit(1)
         logging.debug('Exit')
 
-    def list_records(self, records: list, alias: str = '', show_cmd: bool = False,
-                    use_colors: bool = True) -> None:
-        """List all alias and directory records on the console
+    def list_records(self, aliases: list, show_cmd: bool = False,
+                     use_colors: bool | None = None) -> None:
+        """List alias and directory records on the console
 
         Args:
-            records: as a list of dict's containing records with alias, directory and command
-            alias: As a string to search and list all the records starting with the characters
-                in this string.
+            aliases: A sorted list of the aliases of the records to list, normally the result
+                of Records.matches.
             show_cmd: Default False. If True it will list the associated commands to each
                 record.
-            use_colors: Default True and will will toggle the output color if the first character
-                changes for the alias in the next record in records. If set to False no colors
-                will be used.
+            use_colors: If True it will toggle the output color if the first character
+                changes for the next alias in aliases. If set to False no colors
+                will be used. Default None, use colors only if stdout is a terminal.
 
         Returns: None
         """
         logging.debug('Enter')
-        first_char = ''
+        if use_colors is None:
+            use_colors = sys.stdout.isatty()
         if use_colors is True:
-            current_color = self._color.light_blue
+            palette = (self._color.light_blue, self._color.light_yellow)
+            reset = self._color.reset
         else:
-            current_color = ''
-
-        for record in records:
-            if use_colors is True and not record[0].startswith(first_char):
-                if current_color == self._color.light_blue:
-                    current_color = self._color.light_yellow
-                else:
-                    current_color = self._color.light_blue
-            first_char = record[0][0]
-
-            if record[0].startswith(alias):
+            palette = ('', '')
+            reset = ''
+        # Collect all lines and write them at once instead of one print per record
+        lines = []
+
+        # Alternate between the two palette colors for each group of aliases with the same
+        # first character, starting with light blue. A color stays in effect until the next
+        # one, so it is only emitted once per group and not on every line.
+        groups = itertools.groupby(aliases, key=operator.itemgetter(0))
+        for (_, group), color in zip(groups, itertools.cycle(palette)):
+            lines.append(color)
+            for alias in group:
+                directory, command = self.records[alias]
                 if show_cmd is True:
-                    print(f'{current_color}[{record[0]}] {record[1]} : {record[2]}')
+                    lines.append(f'[{alias}] {directory} : {command}\n')
                 else:
-                    print(f'{current_color}[{record[0]}] {record[1]}')
-        print(self._color.reset, end='')
+                    lines.append(f'[{alias}] {directory}\n')
+        lines.append(reset)
+        sys.stdout.write(''.join(lines))
         logging.debug('Exit')
 
     def read_input(self, hook_message: str, prompt: str = 'fcd> ') -> str:
@@ -349,30 +556,70 @@ class Fcd:
         Returns: The output given from the input() call as a string.
         """
         logging.debug('Enter: %s: %s', hook_message, prompt)
-        readline.parse_and_bind("tab: complete")
-        readline.set_completer(self._completer.complete)
+        # Only imported when needed, loading readline is a noticeable part of the startup time
+        # and most calls never read any input.
+        import readline # pylint: disable=import-outside-toplevel
+        if self._completer is None:
+            self._completer = TabComplete(self.records)
+            readline.parse_and_bind("tab: complete")
+            readline.set_completer(self._completer.complete)
+
         def hook():
             readline.insert_text(hook_message)
             readline.redisplay()
 
         readline.set_pre_input_hook(hook)
-        line = input(prompt)
+        try:
+            line = input(prompt)
+        finally:
+            readline.set_pre_input_hook(None)
         logging.debug('Exit: %s', line)
         return line
 
-    def alias_handler(self, alias: str, records: list) -> None:
+    def select_alias(self, alias: str, prompt: str = 'fcd> ', show_cmd: bool = False) -> str:
+        """List the records matching a partial alias and read input with tab completion until
+        an alias found in the database is given. The records are listed again after an
+        attempt only if it changed which records match, narrowed down from the previous
+        list when the new input extends it.
+
+        Args:
+            alias: A string containing a partial or empty alias, also used as prepared text
+                for the input.
+            prompt: A string which will be used as the prompt in the call to input().
+            show_cmd: Default False. If True the associated commands are listed too.
+
+        Returns: The selected alias as a string.
+        """
+        logging.debug('Enter: alias="%s"', alias)
+        candidates = self.records.matches(alias)
+        self.list_records(candidates, show_cmd)
+        while alias not in self._db:
+            line = self.read_input(alias, prompt)
+            if line not in self._db:
+                if line.startswith(alias):
+                    # Same or longer prefix, only the previous candidates can still match
+                    matches = [candidate for candidate in candidates
+                               if candidate.startswith(line)]
+                else:
+                    matches = self.records.matches(line)
+                if matches != candidates:
+                    # The previous list is still on screen above the prompt otherwise
+                    candidates = matches
+                    self.list_records(candidates, show_cmd)
+            alias = line
+        logging.debug('Exit: %s', alias)
+        return alias
+
+    def alias_handler(self, alias: str) -> None:
         """Handles all combinations of aliases provided as argument on command line
 
         Args:
             alias: A string which can be empty or contain a partial or complete alias.
-            records: All the records in a sorted alphabetic list
 
         Returns: None
         """
         if not isinstance(alias, str):
             raise ValueError(f'Invalid type: {type(alias)}')
-        if not isinstance(records, list):
-            raise ValueError(f'Invalid type: {type(records)}')
         logging.debug('Enter: alias="%s"', alias)
 
         if alias in self._db:
@@ -380,11 +627,7 @@ class Fcd:
             self.save_for_later_execution(alias)
         else:
             # Incomplete/partial alias, let's use tab completion
-            self.list_records(records, alias)
-            while alias not in self._db:
-                alias = self.read_input(alias)
-                if alias not in self._db:
-                    self.list_records(records, alias)
+            alias = self.select_alias(alias)
             # Now we have a complete alias found in database
             self.save_for_later_execution(alias)
         logging.debug('Exit')
@@ -407,7 +650,9 @@ class Fcd:
             add_record = {"directory": os.getcwd(), "command": ''}
             print(f'Creating record [{arg_add}] "{os.getcwd()}"')
             self._db.update({arg_add : add_record})
-            self._db_handler.save(self._db)
+            if self._records is not None:
+                self._records.add(arg_add)
+            self._dirty = True
         else:
             print(f'{self._color.light_red}Alias "{arg_add}" already exists, aborting!', end='')
             print(self._color.reset)
@@ -415,16 +660,16 @@ class Fcd:
             sys.exit(1)
         logging.debug('Exit')
 
-    def delete_handler(self, arg_delete: str, records: list) -> None:
+    def delete_handler(self, arg_delete: str | bool) -> None:
         """Handles the delete command line argument
 
         Args:
-            arg_delete: String containing a complete, partial or empty record tag.
-            records: All the records in a sorted alphabetic list
+            arg_delete: String containing a complete, partial or empty record tag, or True if
+                -d was given without a value and the record should be selected interactively.
 
         Returns: None
         """
-        if not isinstance(arg_delete, str):
+        if not isinstance(arg_delete, (str, bool)):
             raise ValueError(f'Invalid type: {type(arg_delete)}')
         logging.debug('Enter: arg_delete=%s', arg_delete)
 
@@ -434,83 +679,59 @@ class Fcd:
                 alias = '' # tab pre_input_hook empty
             else:
                 alias = arg_delete
-            self.list_records(records, alias)
-            while alias not in self._db:
-                alias = self.read_input(alias, 'fcd (delete entry)> ')
-                if alias not in self._db:
-                    self.list_records(records, alias)
+            alias = self.select_alias(alias, 'fcd (delete entry)> ')
             # Match found through tab completion
-            self._db.pop(alias)
-            tmp_records = records
-            for record in records:
-                if record[0] == alias:
-                    tmp_records.remove(record)
-            records = tmp_records
-            print(f'"{alias}" deleted')
         else:
             # Exact argument match found
-            self._db.pop(arg_delete)
-            tmp_records = records
-            for record in records:
-                if record[0] == arg_delete:
-                    tmp_records.remove(record)
-            records = tmp_records
-            print(f'"{arg_delete}" deleted')
-        self._db_handler.save(self._db)
+            alias = arg_delete
+        self._db.pop(alias)
+        if self._records is not None:
+            self._records.remove(alias)
+        print(f'"{alias}" deleted')
+        self._dirty = True
         logging.debug('Exit')
 
-    def command_handler(self, args: dict, records: list) -> None:
+    def command_handler(self, arg_command: str | bool, arg_add: str | None = None) -> None:
         """Handles the command line argument for adding or updating a 'command' to a record.
 
         Args:
-            args: All command line arguments as a dict.
-            records: All the records in a sorted alphabetic list.
+            arg_command: The command as a string, or True if it should be asked for.
+            arg_add: The alias given to the add command line argument, if any.
 
         Returns: None
         """
-        if not isinstance(args, dict):
-            raise ValueError(f'Invalid type: {type(args)}')
-        if not isinstance(records, list):
-            raise ValueError(f'Invalid type: {type(records)}')
-        logging.debug('Enter: cmd=%s', args.get('command'))
-
-        if args.get('add') in self._db:
-            alias = args.get('add')
+        if not isinstance(arg_command, (str, bool)):
+            raise ValueError(f'Invalid type: {type(arg_command)}')
+        logging.debug('Enter: cmd=%s', arg_command)
+
+        if arg_add in self._db:
+            alias = arg_add
         else:
-            alias = '' # tab pre_input_hook empty
-            self.list_records(records, alias, True)
             print("Select which entry to add or update command:")
-            while alias not in self._db:
-                alias = self.read_input(alias, 'fcd (select entry)> ')
-                if alias not in self._db:
-                    self.list_records(records, alias, True)
+            # tab pre_input_hook empty
+            alias = self.select_alias('', 'fcd (select entry)> ', True)
 
-        if args.get('command') is True:
-            readline.set_pre_input_hook(None) # reset from previous setting in the read_input above
+        if arg_command is True:
+            # Enables line editing for input()
+            import readline # pylint: disable=import-outside-toplevel,unused-import
             cmd = input('Provide command to be added or updated: ')
         else:
-            cmd = args.get('command')
+            cmd = arg_command
 
-        self._db[alias]['command'] = cmd
+        record = self._db[alias]
+        record['command'] = cmd
         print(f'Updated or added command to record: [{alias}] ', end='')
-        print(f'{self._db[alias]["directory"]} : {self._db[alias]["command"]}')
-        self._db_handler.save(self._db)
+        print(f'{record["directory"]} : {cmd}')
+        self._dirty = True
         logging.debug('Exit')
 
-    def clean_up(self) -> None:
-        """ Cleanup and remove files from previous execution
+    def flush(self) -> None:
+        """Save the database to file if it has been changed since it was loaded or last saved
         """
-        logging.debug('Enter')
-        try:
-            if os.path.exists(self._files.dir_file):
-                logging.debug('Removing %s', self._files.dir_file)
-                os.remove(self._files.dir_file)
-            if os.path.exists(self._files.cmd_file):
-                logging.debug('Removing %s', self._files.cmd_file)
-                os.remove(self._files.cmd_file)
-        except OSError as io_error:
-            logging.error(io_error)
-            sys.exit(io_error)
+        logging.debug('Enter: dirty=%s', self._dirty)
+        if self._dirty is True:
+            self._db_handler.save(self._db)
+            self._dirty = False
         logging.debug('Exit')
 
     def args_handler(self, args) -> None:
@@ -521,51 +742,72 @@ class Fcd:
 
         Returns: None
         """
-
-        # Create a list of all records in alphabetic order which will be used as a helper in
-        # combination with the tab completion.
         logging.debug('Enter')
-        records = []
-        for alias in self._aliases:
-            record = [alias, self._db[alias]['directory'],
-                      self._db[alias]['command']]
-            records.append(record)
-        logging.debug('records=%s', records)
+
+        alias, arg_add, arg_delete, arg_command = (
+            args.get(key) for key in ('alias', 'add', 'delete', 'command'))
 
         # Act on zero or more command line arguments provided.
         try:
-            alias = args.get('alias')
             if alias is not None or len(sys.argv) == 1:
                 # A partial, complete or no alias at all given from command line
                 if len(sys.argv) == 1:
                     alias = '' # No alias provided on command line, create an empty string
-                self.alias_handler(alias, records)
+                self.alias_handler(alias)
 
-            if args.get('add') is not None:
-                self.add_handler(args.get('add'))
-            elif args.get('delete') is not None:
+            if arg_add is not None:
+                self.add_handler(arg_add)
+            elif arg_delete is not None:
                 # Delete is mutually exclusive with Add
-                self.delete_handler(args.get('delete'), records)
+                self.delete_handler(arg_delete)
 
-            if args.get('command') is not None and args.get('delete') is None:
-                self.command_handler(args, records)
+            if arg_command is not None and arg_delete is None:
+                self.command_handler(arg_command, arg_add)
         except KeyboardInterrupt:
             print('Keyboard interrupt')
             logging.info('Keyboard interrupt')
             sys.exit(1)
+        finally:
+            # Save all changes made by the handlers above with a single write
+            self.flush()
         logging.debug('Exit')
 
 
+def clean_up(files: Files) -> None:
+    """Cleanup and remove files from previous execution. fcd.sh acts on these files whenever
+    the program exits successfully, so this must be done before any other exit, e.g. for
+    --version or --help.
+
+    Args:
+        files: The Files with the dir_file and cmd_file to remove.
+
+    Returns: None
+    """
+    logging.debug('Enter')
+    for filename in (files.dir_file, files.cmd_file):
+        try:
+            os.unlink(filename)
+            logging.debug('Removed %s', filename)
+        except FileNotFoundError:
+            pass
+        except OSError as io_error:
+            logging.error(io_error)
+            sys.exit(io_error)
+    logging.debug('Exit')
+
+
 def main():
     """Main program"""
+    setup_logging()
     logging.debug('Enter')
-    fcd = Fcd()
-    fcd.clean_up()
+    clean_up(Files())
     args = parse_args()
     if args.get('version') is True:
+        # Nothing else to do, skip loading the database
         print(f'v{VERSION}')
         sys.exit(0)
 
+    fcd = Fcd()
     fcd.args_handler(args)
     logging.debug('Exit')
 